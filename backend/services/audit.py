@@ -1,9 +1,12 @@
 from typing import Dict, Any, Optional
 from datetime import datetime
 import json
+import logging
 import uuid
 from .database import db
 
+logger = logging.getLogger(__name__)
+
 class AuditService:
     """Service for audit logging operations."""
     
@@ -37,9 +40,9 @@ class AuditService:
         try:
             created_log = await db.create_audit_log(log_entry)
             return created_log
-        except Exception as e:
+        except Exception:
             # Log error but don't fail the main operation
-            print(f"Failed to create audit log: {str(e)}")
+            logger.exception("Failed to create audit log")
             return log_entry
     
     async def get_logs(self, 
@@ -86,8 +89,8 @@ class AuditService:
                         pass
             
             return logs
-        except Exception as e:
-            print(f"Failed to get audit logs: {str(e)}")
+        except Exception:
+            logger.exception("Failed to get audit logs")
             return []
     
     async def export_logs(self,
@@ -110,8 +113,10 @@ class AuditService:
         - CSV string of audit logs
         """
         try:
-            # Get all matching logs (no pagination for export)
-            logs = await self.get_logs(
+            # Get all matching logs (no pagination for export). Read the raw
+            # rows so stored JSON details are written as-is rather than
+            # parsed by get_logs and re-serialized below.
+            logs = await db.get_audit_logs(
                 user_id=user_id,
                 action=action,
                 resource_type=resource_type,
@@ -128,14 +133,18 @@ class AuditService:
             
             # Add log entries
             for log in logs:
-                # Format details as escaped JSON string
-                details_str = '"' + json.dumps(log.get("details", {})).replace('"', '""') + '"' if log.get("details") else """"
+                # Quote details as a CSV field. Stored strings (JSON or plain
+                # text) are written verbatim; decoded values are JSON-encoded.
+                details = log.get("details")
+                if details and not isinstance(details, str):
+                    details = json.dumps(details)
+                details_str = '"' + details.replace('"', '""') + '"' if details else '""'
                 
                 csv_lines.append(f"{log.get('id', '')},{log.get('user_id', '')},{log.get('action', '')},{log.get('resource_type', '')},{log.get('resource_id', '')},{log.get('timestamp', '')},{details_str},{log.get('ip_address', '')}")
             
             return "\n".join(csv_lines)
-        except Exception as e:
-            print(f"Failed to export audit logs: {str(e)}")
+        except Exception:
+            logger.exception("Failed to export audit logs")
             return "Error exporting logs"
 
 # Create global audit service instance
@@ -1,9 +1,13 @@
+import asyncio
 from typing import Optional, List, Dict, Any
 from supabase import create_client, Client
 from ..core.config import get_settings
 
 settings = get_settings()
 
+class DatabaseError(Exception):
+    """Raised when a database operation fails."""
+
 class DatabaseService:
     """Service for database operations."""
     
@@ -13,14 +17,21 @@ class DatabaseService:
         try:
             self.client = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
         except Exception as e:
-            raise Exception(f"Failed to initialize Supabase client: {str(e)}")
+            raise DatabaseError(f"Failed to initialize Supabase client: {str(e)}") from e
+    
+    async def _execute(self, query: Any) -> Any:
+        """Run a blocking Supabase query off the event loop."""
+        try:
+            return await asyncio.to_thread(query.execute)
+        except Exception as e:
+            raise DatabaseError(str(e)) from e
     
     async def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get user by ID."""
         if not self.client:
-            raise Exception("Database client not initialized")
+            raise DatabaseError("Database client not initialized")
         
-        response = self.client.table('users').select('*').eq('id', user_id).execute()
+        response = await self._execute(self.client.table('users').select('*').eq('id', user_id))
         if response.data:
             return response.data[0]
         return None
@@ -28,9 +39,9 @@ class DatabaseService:
     async def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get user by email."""
         if not self.client:
-            raise Exception("Database client not initialized")
+            raise DatabaseError("Database client not initialized")
         
-        response = self.client.table('users').select('*').eq('email', email).execute()
+        response = await self._execute(self.client.table('users').select('*').eq('email', email))
         if response.data:
             return response.data[0]
         return None
@@ -38,29 +49,29 @@ class DatabaseService:
     async def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create new user."""
         if not self.client:
-            raise Exception("Database client not initialized")
+            raise DatabaseError("Database client not initialized")
         
-        response = self.client.table('users').insert(user_data).execute()
+        response = await self._execute(self.client.table('users').insert(user_data))
         if response.data:
             return response.data[0]
-        raise Exception("Failed to create user")
+        raise DatabaseError("Failed to create user")
     
     async def update_user(self, user_id: str, user_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update user."""
         if not self.client:
-            raise Exception("Database client not initialized")
+            raise DatabaseError("Database client not initialized")
         
-        response = self.client.table('users').update(user_data).eq('id', user_id).execute()
+        response = await self._execute(self.client.table('users').update(user_data).eq('id', user_id))
         if response.data:
             return response.data[0]
-        raise Exception("Failed to update user")
+        raise DatabaseError("Failed to update user")
     
     async def get_case(self, case_id: str) -> Optional[Dict[str, Any]]:
         """Get case by ID."""
         if not self.client:
-            raise Exception("Database client not initialized")
+            raise DatabaseError("Database client not initialized")
         
-        response = self.client.table('cases').select('*').eq('id', case_id).execute()
+        response = await self._execute(self.client.table('cases').select('*').eq('id', case_id))
         if response.data:
             return response.data[0]
         return None
@@ -68,36 +79,36 @@ class DatabaseService:
     async def get_user_cases(self, user_id: str, role: str) -> List[Dict[str, Any]]:
         """Get cases for a user based on their role."""
         if not self.client:
-            raise Exception("Database client not initialized")
+            raise DatabaseError("Database client not initialized")
         
         if role == "client":
-            response = self.client.table('cases').select('*').eq('client_id', user_id).execute()
+            response = await self._execute(self.client.table('cases').select('*').eq('client_id', user_id))
         elif role == "attorney":
-            response = self.client.table('cases').select('*').eq('attorney_id', user_id).execute()
+            response = await self._execute(self.client.table('cases').select('*').eq('attorney_id', user_id))
         else:
-            response = self.client.table('cases').select('*').execute()
+            response = await self._execute(self.client.table('cases').select('*'))
         
         return response.data if response.data else []
     
     async def create_case(self, case_data: Dict[str, Any]) -> Dict[str, Any]:
         """Create new case."""
         if not self.client:
-            raise Exception("Database client not initialized")
+            raise DatabaseError("Database client not initialized")
         
-        response = self.client.table('cases').insert(case_data).execute()
+        response = await self._execute(self.client.table('cases').insert(case_data))
         if response.data:
             return response.data[0]
-        raise Exception("Failed to create case")
+        raise DatabaseError("Failed to create case")
     
     async def update_case(self, case_id: str, case_data: Dict[str, Any]) -> Dict[str, Any]:
         """Update case."""
         if not self.client:
-            raise Exception("Database client not initialized")
+            raise DatabaseError("Database client not initialized")
         
-        response = self.client.table('cases').update(case_data).eq('id', case_id).execute()
+        response = await self._execute(self.client.table('cases').update(case_data).eq('id', case_id))
         if response.data:
             return response.data[0]
-        raise Exception("Failed to update case")
+        raise DatabaseError("Failed to update case")
     
     async def create_audit_log(self, log_entry: Dict[str, Any]) -> Dict[str, Any]:
         """Create a new audit log entry.
@@ -109,12 +120,12 @@ class DatabaseService:
         - Created audit log entry
         """
         if not self.client:
-            raise Exception("Database client not initialized")
+            raise DatabaseError("Database client not initialized")
         
-        response = self.client.table('audit_logs').insert(log_entry).execute()
+        response = await self._execute(self.client.table('audit_logs').insert(log_entry))
         if response.data:
             return response.data[0]
-        raise Exception("Failed to create audit log entry")
+        raise DatabaseError("Failed to create audit log entry")
     
     async def get_audit_logs(
         self,
@@ -141,7 +152,14 @@ class DatabaseService:
         - List of audit log entries
         """
         if not self.client:
-            raise Exception("Database client not initialized")
+            raise DatabaseError("Database client not initialized")
+        
+        if skip < 0:
+            raise ValueError(f"skip must be non-negative, got {skip}")
+        
+        # An empty page can't match any rows; skip the round trip
+        if limit <= 0:
+            return []
         
         query = self.client.table('audit_logs').select('*')
         
@@ -163,7 +181,7 @@ class DatabaseService:
         # Order by timestamp descending (newest first)
         query = query.order('timestamp', desc=True)
         
-        response = query.execute()
+        response = await self._execute(query)
         return response.data if response.data else []
 
 # Create global database service instance